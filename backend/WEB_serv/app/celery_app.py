@@ -1,12 +1,38 @@
 """Celery application configuration for Anix Flow."""
 
+import zlib
+
 from celery import Celery
+from kombu import Queue
+from kombu.serialization import register
+from kombu.utils import json
 
 from app.config import get_settings
 
 
 settings = get_settings()
 
+INTERACTIVE_QUEUE = "interactive"
+BULK_QUEUE = "bulk"
+RESULT_SERIALIZER = "json-zlib"
+
+
+def _dumps_compressed(obj: object) -> bytes:
+    return zlib.compress(json.dumps(obj).encode())
+
+
+def _loads_compressed(data: bytes) -> object:
+    return json.loads(zlib.decompress(data))
+
+
+register(
+    RESULT_SERIALIZER,
+    _dumps_compressed,
+    _loads_compressed,
+    content_type="application/x-json-zlib",
+    content_encoding="binary",
+)
+
 
 celery_app = Celery(
     "anix_flow",
@@ -15,5 +41,27 @@ celery_app = Celery(
     include=["app.tasks"],
 )
 
+celery_app.conf.update(
+    task_queues=(
+        Queue(INTERACTIVE_QUEUE, routing_key=INTERACTIVE_QUEUE),
+        Queue(BULK_QUEUE, routing_key=BULK_QUEUE),
+    ),
+    task_default_queue=INTERACTIVE_QUEUE,
+    task_default_routing_key=INTERACTIVE_QUEUE,
+    # Bulk fan-out never shares a queue with user-facing tasks, so a large
+    # regeneration cannot starve them.
+    task_routes={"app.tasks.bulk.*": {"queue": BULK_QUEUE}},
+    # Fair scheduling: a worker reserves one message per process at a time.
+    worker_prefetch_multiplier=settings.celery_prefetch_multiplier,
+    # Late-acked bulk chunks are redelivered if still unacked after this
+    # timeout, so it must exceed the longest chunk.
+    broker_transport_options={"visibility_timeout": settings.celery_visibility_timeout},
+    # Result keys expire instead of piling up in Redis, and results are
+    # stored as zlib-compressed JSON.
+    result_expires=settings.celery_result_expires,
+    result_serializer=RESULT_SERIALIZER,
+    result_accept_content=["json", RESULT_SERIALIZER],
+)
+
 
-__all__ = ["celery_app"]
+__all__ = ["BULK_QUEUE", "INTERACTIVE_QUEUE", "RESULT_SERIALIZER", "celery_app"]
@@ -28,6 +28,12 @@ class Settings(BaseSettings):
     gpt_api_base_url: AnyUrl = Field(..., validation_alias="GPT_API_BASE_URL")
     gpt_api_key: str = Field(..., validation_alias="GPT_API_KEY")
 
+    celery_prefetch_multiplier: int = Field(default=1, ge=1, validation_alias="CELERY_PREFETCH_MULTIPLIER")
+    celery_result_expires: int = Field(default=3600, ge=60, validation_alias="CELERY_RESULT_EXPIRES")
+    celery_bulk_chunk_size: int = Field(default=25, ge=1, validation_alias="CELERY_BULK_CHUNK_SIZE")
+    celery_bulk_max_in_flight: int = Field(default=4, ge=1, validation_alias="CELERY_BULK_MAX_IN_FLIGHT")
+    celery_visibility_timeout: int = Field(default=7200, ge=60, validation_alias="CELERY_VISIBILITY_TIMEOUT")
+
     cors_origins: list[str] = Field(default_factory=lambda: ["*"])  # TODO: ограничить продакшен-ориджины
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
 
@@ -1,5 +1,6 @@
 """Task package for Celery workers."""
 
+from .bulk import fan_out
 from .example import ping
 
-__all__ = ["ping"]
+__all__ = ["fan_out", "ping"]
@@ -0,0 +1,115 @@
+"""Chunked fan-out of bulk jobs with a bounded number of in-flight chunks."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from celery.result import AsyncResult
+from celery.utils import uuid
+from celery.utils.log import get_task_logger
+
+from app.celery_app import celery_app
+from app.config import get_settings
+
+logger = get_task_logger(__name__)
+
+
+def _key(job_id: str, *parts: object) -> str:
+    return ":".join(("anix-bulk", job_id, *map(str, parts)))
+
+
+@celery_app.task(
+    name="app.tasks.bulk.process_chunk", acks_late=True, reject_on_worker_lost=True, ignore_result=True
+)
+def process_chunk(job_id: str, task_name: str, index: int, total: int) -> None:
+    """Run ``task_name`` over chunk ``index`` of the job and hand off to the next one.
+
+    Items run inline in this worker, so ``self.retry()`` inside the task cannot
+    schedule a retry: such an item, like any item whose task raises, is logged
+    and reported as failed without aborting the rest of the job.
+    """
+
+    backend = celery_app.backend
+    task = celery_app.tasks[task_name]
+    items = backend.decode(backend.get(_key(job_id, "chunk", index)))
+
+    failed = []
+    for item in items:
+        try:
+            task(item)
+        except Exception:
+            logger.exception("Bulk task %s failed for %r", task_name, item)
+            failed.append(item)
+    backend.set(
+        _key(job_id, "report", index), backend.encode({"processed": len(items) - len(failed), "failed": failed})
+    )
+
+    if backend.incr(_key(job_id, "done")) == total:
+        summarize.apply_async((job_id, total), task_id=job_id)
+        return
+
+    # This lane is finished with its chunk, so it may publish the next one
+    # without exceeding the in-flight limit.
+    next_index = backend.incr(_key(job_id, "cursor"))
+    if next_index < total:
+        process_chunk.delay(job_id, task_name, next_index, total)
+
+
+@celery_app.task(name="app.tasks.bulk.summarize")
+def summarize(job_id: str, total: int) -> dict[str, Any]:
+    """Merge per-chunk reports into the result of the job and drop its state."""
+
+    backend = celery_app.backend
+    summary: dict[str, Any] = {"processed": 0, "failed": []}
+    for index in range(total):
+        report = backend.decode(backend.get(_key(job_id, "report", index)))
+        summary["processed"] += report["processed"]
+        summary["failed"].extend(report["failed"])
+        backend.delete(_key(job_id, "report", index))
+        backend.delete(_key(job_id, "chunk", index))
+    backend.delete(_key(job_id, "cursor"))
+    backend.delete(_key(job_id, "done"))
+    return summary
+
+
+def fan_out(
+    task_name: str,
+    items: Iterable[Any],
+    *,
+    chunk_size: int | None = None,
+    max_in_flight: int | None = None,
+) -> AsyncResult:
+    """Dispatch ``task_name`` over ``items`` to the bulk queue in chunks.
+
+    Chunks are kept in the result backend and messages carry only their index.
+    At most ``max_in_flight`` chunks are queued or running at a time: each
+    finished chunk publishes the next pending one. The returned result resolves
+    to ``{"processed": int, "failed": list}`` where ``failed`` holds the items
+    whose task raised.
+    """
+
+    if task_name not in celery_app.tasks:
+        raise ValueError(f"Unknown Celery task: {task_name!r}")
+
+    settings = get_settings()
+    chunk_size = chunk_size or settings.celery_bulk_chunk_size
+    max_in_flight = max_in_flight or settings.celery_bulk_max_in_flight
+    items = list(items)
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    job_id = uuid()
+    if not chunks:
+        return summarize.apply_async((job_id, 0), task_id=job_id)
+
+    backend = celery_app.backend
+    for index, chunk in enumerate(chunks):
+        backend.set(_key(job_id, "chunk", index), backend.encode(chunk))
+    lanes = min(max_in_flight, len(chunks))
+    backend.set(_key(job_id, "cursor"), str(lanes - 1))
+    backend.set(_key(job_id, "done"), "0")
+
+    for index in range(lanes):
+        process_chunk.delay(job_id, task_name, index, len(chunks))
+    return AsyncResult(job_id, app=celery_app)
+
+
+__all__ = ["fan_out", "process_chunk", "summarize"]
@@ -0,0 +1 @@
+"""Benchmarks for the Anix Flow web service."""
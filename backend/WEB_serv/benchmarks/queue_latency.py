@@ -0,0 +1,110 @@
+"""Interactive task latency under bulk load.
+
+Runs in-process workers against an in-memory broker (or the Redis instance
+given in ``BENCH_BROKER_URL``) and compares the queue wait of interactive
+probes in three scenarios:
+
+* ``idle`` -- probes only;
+* ``shared`` -- bulk items sent one by one to the same queue as probes;
+* ``routed`` -- bulk items dispatched through :func:`app.tasks.bulk.fan_out`
+  to the dedicated bulk queue.
+
+Usage::
+
+    python -m benchmarks.queue_latency --items 400 --work-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from contextlib import ExitStack
+
+from benchmarks._env import apply_placeholder_settings
+
+apply_placeholder_settings()
+
+from celery.contrib.testing.worker import start_worker  # noqa: E402
+
+from app.celery_app import BULK_QUEUE, INTERACTIVE_QUEUE, celery_app  # noqa: E402
+from app.tasks.bulk import fan_out  # noqa: E402
+
+BROKER_URL = os.environ.get("BENCH_BROKER_URL", "memory://")
+
+celery_app.conf.update(
+    broker_url=BROKER_URL,
+    result_backend=os.environ.get("BENCH_RESULT_BACKEND", "cache+memory://"),
+)
+if BROKER_URL.startswith("memory://"):
+    # The in-memory transport polls its queues once a second by default.
+    celery_app.conf.broker_transport_options = {**celery_app.conf.broker_transport_options, "polling_interval": 0.001}
+
+
+@celery_app.task(name="bench.probe")
+def probe(sent_at: float) -> float:
+    return time.perf_counter() - sent_at
+
+
+@celery_app.task(name="bench.render")
+def render(work_ms: float) -> None:
+    time.sleep(work_ms / 1000)
+
+
+def measure_probes(count: int, interval: float) -> list[float]:
+    results = []
+    for _ in range(count):
+        results.append(probe.delay(time.perf_counter()))
+        time.sleep(interval)
+    return [result.get(timeout=60) * 1000 for result in results]
+
+
+def run_scenario(name: str, args: argparse.Namespace) -> dict[str, float]:
+    bulk_result = None
+    if name == "shared":
+        for _ in range(args.items):
+            render.apply_async((args.work_ms,), queue=INTERACTIVE_QUEUE)
+    elif name == "routed":
+        bulk_result = fan_out(
+            render.name,
+            [args.work_ms] * args.items,
+            chunk_size=args.chunk_size,
+            max_in_flight=args.max_in_flight,
+        )
+
+    latencies = measure_probes(args.probes, args.probe_interval_ms / 1000)
+    if bulk_result is not None:
+        bulk_result.get(timeout=600)
+
+    return {
+        "p50": statistics.median(latencies),
+        "p95": statistics.quantiles(latencies, n=20)[-1],
+        "max": max(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=400, help="bulk items per scenario")
+    parser.add_argument("--work-ms", type=float, default=20, help="simulated cost of one bulk item")
+    parser.add_argument("--chunk-size", type=int, default=10)
+    parser.add_argument("--max-in-flight", type=int, default=2)
+    parser.add_argument("--probes", type=int, default=50)
+    parser.add_argument("--probe-interval-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        # One solo worker per queue: the embedded worker runs the blocking
+        # event loop, where pooled workers would add seconds of ack latency.
+        for queue in (INTERACTIVE_QUEUE, BULK_QUEUE):
+            stack.enter_context(start_worker(celery_app, queues=[queue], pool="solo", perform_ping_check=False))
+
+        print(f"{'scenario':<10}{'p50, ms':>10}{'p95, ms':>10}{'max, ms':>10}")
+        for name in ("idle", "shared", "routed"):
+            stats = run_scenario(name, args)
+            print(f"{name:<10}{stats['p50']:>10.1f}{stats['p95']:>10.1f}{stats['max']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
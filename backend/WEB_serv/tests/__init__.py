@@ -0,0 +1 @@
+"""Tests for the Anix Flow web service."""
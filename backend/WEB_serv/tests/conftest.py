@@ -0,0 +1,25 @@
+"""Shared fixtures: an embedded Celery worker on the in-memory broker."""
+
+import pytest
+
+from benchmarks._env import apply_placeholder_settings
+
+apply_placeholder_settings()
+
+from celery.contrib.testing.worker import start_worker  # noqa: E402
+
+from app.celery_app import BULK_QUEUE, INTERACTIVE_QUEUE, celery_app  # noqa: E402
+
+celery_app.conf.update(
+    broker_url="memory://",
+    result_backend="cache+memory://",
+    broker_transport_options={"polling_interval": 0.001},
+)
+
+
+@pytest.fixture(scope="session")
+def celery_worker():
+    with start_worker(
+        celery_app, queues=[INTERACTIVE_QUEUE, BULK_QUEUE], pool="solo", perform_ping_check=False
+    ) as worker:
+        yield worker
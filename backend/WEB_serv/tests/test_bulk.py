@@ -0,0 +1,90 @@
+"""Tests for chunked bulk fan-out."""
+
+import zlib
+
+import pytest
+from celery import current_task
+from celery.signals import before_task_publish
+
+from app.celery_app import BULK_QUEUE, RESULT_SERIALIZER, celery_app
+from app.tasks.bulk import fan_out, process_chunk
+
+seen: list[int] = []
+
+
+@celery_app.task(name="tests.record")
+def record(item: int) -> None:
+    if item < 0:
+        raise ValueError(item)
+    seen.append(item)
+
+
+@pytest.fixture
+def published_chunks():
+    """Record chunk indices as they are published and the peak number in flight."""
+
+    state = {"indices": [], "in_flight": 0, "peak": 0}
+
+    def on_publish(sender=None, body=None, **kwargs):
+        if sender != process_chunk.name:
+            return
+        if current_task and current_task.name == process_chunk.name:
+            # The publishing chunk has finished and hands its slot over.
+            state["in_flight"] -= 1
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        state["indices"].append(body[0][2])
+
+    before_task_publish.connect(on_publish, weak=False)
+    yield state
+    before_task_publish.disconnect(on_publish)
+
+
+def test_bulk_tasks_are_routed_to_bulk_queue():
+    router = celery_app.amqp.router
+    for name in ("app.tasks.bulk.process_chunk", "app.tasks.bulk.summarize"):
+        assert router.route({}, name)["queue"].name == BULK_QUEUE
+
+
+def test_unknown_task_is_rejected_before_publishing(published_chunks):
+    with pytest.raises(ValueError):
+        fan_out("tests.missing", [1, 2, 3])
+    assert published_chunks["indices"] == []
+
+
+def test_empty_input(celery_worker):
+    assert fan_out(record.name, []).get(timeout=10) == {"processed": 0, "failed": []}
+
+
+def test_items_are_processed_in_bounded_window(celery_worker, published_chunks):
+    seen.clear()
+
+    result = fan_out(record.name, range(23), chunk_size=5, max_in_flight=2).get(timeout=10)
+
+    assert result == {"processed": 23, "failed": []}
+    assert sorted(seen) == list(range(23))
+    assert published_chunks["indices"] == [0, 1, 2, 3, 4]
+    assert published_chunks["peak"] == 2
+
+
+def test_failed_items_do_not_stop_the_job(celery_worker):
+    seen.clear()
+    items = [0, 1, -2, 3, 4, -5, 6]
+
+    result = fan_out(record.name, items, chunk_size=2, max_in_flight=2).get(timeout=10)
+
+    assert result == {"processed": 5, "failed": [-2, -5]}
+    assert sorted(seen) == [0, 1, 3, 4, 6]
+
+
+def test_results_are_stored_compressed(celery_worker):
+    backend = celery_app.backend
+    result = fan_out(record.name, range(10), chunk_size=3)
+    result.get(timeout=10)
+
+    stored = backend.get(backend.get_key_for_task(result.id))
+
+    assert backend.serializer == RESULT_SERIALIZER
+    meta = backend.decode(stored)
+    assert meta["result"] == {"processed": 10, "failed": []}
+    assert zlib.decompress(stored).startswith(b"{")